@@ -35,6 +35,10 @@ import string
 # watch the video: https://www.youtube.com/watch?v=ybkkiGtJmkM
 # Enigma Machine code was broken by Alan Turing and his team.
 
+# encryptable letters and their indices, built once instead of for 
+# every symbol: both 'A' and 'a' have index 0
+_CODES = {letter: ord(letter.upper()) - 65 for letter in string.ascii_letters}
+
 
 class EnigmaMachine:
     """represents a physical Enigma Machine from WWII.
@@ -63,6 +67,10 @@ class EnigmaMachine:
             alike to a rotor with one exception: it does not spin and it 
             doesn't change. Its job to receive a letter, change it to a 
             corresponding letter, and launch it the opposite way.
+
+    Module-level ROTORS, INV_ROTORS, REFLECTOR, INV_REFLECTOR and NOTCHES
+    hold the same data as letter indices for the encryption itself, and
+    ROTOR_TABLES, INV_ROTOR_TABLES hold rotors fused with positions.
     """
 
     direct = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
@@ -96,7 +104,8 @@ class EnigmaMachine:
         Args:
             rotor_set (str, optional): three digits shows what rotors are
                 used from the original EnigmaMachine.rotors dictionary. 
-                Defaults to '111'.
+                A tuple of three rotor numbers, e.g. (1, 2, 3), works as
+                well. Defaults to '111'.
             position (list, optional): sets rotor position, three numbers
                 from 0 to 25. Defaults to [0, 0, 0].
             set_plugboard (list, optional): a list that accepts pairs of 
@@ -114,10 +123,18 @@ class EnigmaMachine:
                 beginning of the operation
             wheel3pos (int): an attribute storing 3 rotor position at the
                 beginning of the operation
-            plugboard (list): a python list of sets, each containing a 
-                couple of letters to be swapped
+            plugboard (list): a python list of strings, each containing
+                a couple of letters to be swapped, e.g. 'AB',
                 in the end of encryption and decryption. If no 
-                set_plugboard parameter is passed, defaults to [].
+                set_plugboard parameter is passed, defaults to []. 
+                Read-only, derived from _plug.
+            _plug (bytearray): the plugboard as a 26-byte permutation of
+                letter indices, _plug[ord(letter) - 65] is the index of 
+                the letter it is swapped with. Unpaired letters map onto
+                themselves.
+            _plug_table (str): 256-symbol str.translate() table built 
+                from _plug, used to swap letters of a whole message at 
+                once.
             mode (int, optional): defines whether to retain the original 
                 word length or chop the message into blocks with n 
                 symbols each. Defaults to 0. when 0, original word length
@@ -125,13 +142,142 @@ class EnigmaMachine:
         """
 
         self.rotor_set = rotor_set
-        self.wheel1pos = position[0]
-        self.wheel2pos = position[1]
-        self.wheel3pos = position[2]
-        self.plugboard = []
+        self.positionSetter(position)
+        self._plug = bytearray(range(26))
+        self._updatePlugTable()
         self.mode = mode
         self.plugboardSetter(set_plugboard)
 
+    @property
+    def rotor_set(self):
+        """rotors installed, as they were set: '123' or (1, 2, 3)"""
+        return self._rotor_set
+
+    @rotor_set.setter
+    def rotor_set(self, rotor_set):
+        """installs a rotor set and caches its tables
+
+        Rotor tables are stored as bytes of letter indices, so the
+        encryption does not have to parse rotor numbers and look them
+        up in EnigmaMachine.rotors for every letter. Each table is fused
+        with the rotor position shift: table[position][code] is the
+        letter index after that rotor. Tables of all rotors are built at
+        module load, the setter only picks them. Notches of the 1st
+        and 2nd rotors are cached as frozensets for rotorHandler().
+        Cached permutations of the previous rotor set are dropped, unless
+        the same rotors are installed again.
+
+        Args:
+            rotor_set (str or tuple): three digits, e.g. '123', or three
+                rotor numbers, e.g. (1, 2, 3)
+        """
+        numbers = tuple(int(digit) for digit in rotor_set)
+        # rotors are looked up by index, so a number outside of 
+        # EnigmaMachine.rotors must not reach the tables: 0 would pick 
+        # the last rotor
+        if len(numbers) != 3 or not all(
+                1 <= number <= len(ROTORS) for number in numbers):
+            raise AssertionError(
+                "Rotor set is invalid. Please, enter three rotor numbers "
+                f"from 1 to {len(ROTORS)}, e.g. '123'.")
+        self._rotor_set = rotor_set
+        # rotor numbers are parsed once, as indices of the ROTORS tuple
+        indices = tuple(number - 1 for number in numbers)
+        if indices == getattr(self, "_indices", None):
+            # the same rotors are set again (the GUI does it before every
+            # encryption), so all cached tables are still valid
+            return
+        self._indices = indices
+        self._r1, self._r2, self._r3 = (
+            ROTOR_TABLES[index] for index in indices)
+        self._r1inv, self._r2inv, self._r3inv = (
+            INV_ROTOR_TABLES[index] for index in indices)
+        self._notch1 = NOTCHES[indices[0]]
+        self._notch2 = NOTCHES[indices[1]]
+        # memos keyed by the rotor position index
+        # wheel1pos + 26 * wheel2pos + 676 * wheel3pos, filled as
+        # positions are visited
+        self._fullperm = {}
+        self._fullperm_inv = {}
+        # index of the position the rotors turn to from each position
+        self._steps = {}
+        self._specializePaths()
+
+    @staticmethod
+    def _shiftedRotor(rotor: bytes, inverse: bool = False) -> tuple:
+        """fuses a rotor table with all 26 rotor positions
+
+        Args:
+            rotor (bytes): rotor as letter indices
+            inverse (bool, optional): if True, rotor is an inverse table
+                and the position is subtracted after the lookup instead
+                of being added before it. Defaults to False.
+
+        Returns:
+            tuple: 26 bytes.translate() tables, one for each rotor 
+                position, where table[code] is the letter index after 
+                the rotor
+        """
+        if inverse:
+            return tuple(
+                bytes((rotor[code] - position) % 26
+                      for code in range(26)).ljust(256, b"\0")
+                for position in range(26))
+        return tuple(
+            bytes(rotor[(code + position) % 26]
+                  for code in range(26)).ljust(256, b"\0")
+            for position in range(26))
+
+    def _specializePaths(self):
+        """builds signal path functions specialized for the installed 
+        rotor set
+
+        Rotor tables are bound as local names of the built functions, so
+        letters travel through the rotors without any attribute or 
+        dictionary lookups. Each function takes the three rotor positions
+        and returns the path for all 26 letters as a string: i-th symbol
+        is the letter that EnigmaMachine.direct[i] turns into.
+
+        All 26 letter indices pass each stage at once: bytes.translate()
+        looks every byte up in the stage table in C, so a path costs seven
+        translate() calls instead of 26 * 7 Python lookups.
+        """
+        r1, r2, r3 = self._r1, self._r2, self._r3
+        r1inv, r2inv, r3inv = self._r1inv, self._r2inv, self._r3inv
+        reflector = REFLECTOR_TABLE
+        inv_reflector = INV_REFLECTOR_TABLE
+        alphabet = bytes(range(26))
+        letters = LETTERS
+
+        def encryption_path(w1, w2, w3):
+            # signal travels forwards, 1-2-3 rotors
+            path = alphabet.translate(r1[w1])  # after rotor 1
+            path = path.translate(r2[w2])  # after rotor 2
+            path = path.translate(r3[w3])  # after rotor 3
+            # after the reflector
+            path = path.translate(reflector)
+            # now signal travels backwards, 3-2-1 rotors
+            path = path.translate(r3[w3])  # after rotor 3
+            path = path.translate(r2[w2])  # after rotor 2
+            path = path.translate(r1[w1])  # after rotor 1
+            return path.translate(letters).decode()
+
+        def decryption_path(w1, w2, w3):
+            # Signal travels forwards, 1-2-3 rotors
+            path = alphabet.translate(r1inv[w1])  # after rotor 1
+            path = path.translate(r2inv[w2])  # after rotor 2
+            path = path.translate(r3inv[w3])  # after rotor 3
+
+            path = path.translate(inv_reflector)  # after the reflector
+
+            path = path.translate(r3inv[w3])  # after rotor 3
+            path = path.translate(r2inv[w2])  # after rotor 2
+            path = path.translate(r1inv[w1])  # after rotor 1
+            return path.translate(letters).decode()
+
+        self._encryption_path = encryption_path
+        self._decryption_path = decryption_path
+
     def positionSetter(self, pos: list = None):
         """takes list of positions as an argument, sets them as 
         attributes wheel1pos, wheel2pos, wheel3pos of the instance
@@ -152,51 +298,50 @@ class EnigmaMachine:
             self.wheel2pos = pos[1] % 26
             self.wheel3pos = pos[2] % 26
 
+    @property
+    def plugboard(self) -> list:
+        """letter pairs currently on the plugboard, e.g. ['AB', 'CT']
+
+        Pairs are read off the _plug permutation in alphabetical order,
+        only when they are needed, so plugboard changes update a single
+        table. Letters of each pair are sorted as well, so the same pair
+        is always the same string.
+        """
+        return [chr(code + 65) + chr(partner + 65)
+                for code, partner in enumerate(self._plug) if partner > code]
+
     def add_pair(self, pair: str):
-        """adds set(pair) to the plugboard of the instance.
+        """adds pair to the plugboard of the instance as a couple of 
+        letters.
 
         Args:
             pair (str): input couple of letters.
         """
         pair = pair.upper()  # Only capital letters are used
         assert (
-            len(pair) == 2 and type(pair) == str
+            len(pair) == 2 and type(pair) == str and pair.isascii()
+            and pair.isalpha()
         ), "Entered pair is invalid. Please, pass the pair of letters as 'AB'."
         # checks if pair consists of the same letter. There is no common 
         # sense to swap the letter on itself,
         # so in this case, the method does nothing.
         if pair[0] == pair[1]:
             return
-        # checks if the pair set already in self.plugboard
-        if set(pair) not in self.plugboard:
-            # if neither of pair set elements exist in any of the pair 
-            # sets, adds pair as a set() to self.pluigboard
-            if all([
-                    set(pair[0]).issubset(item) == False
-                    for item in self.plugboard
-            ]) and all([
-                    set(pair[1]).issubset(item) == False
-                    for item in self.plugboard
-            ]):
-                self.plugboard.append(set(pair))
-            else:
-                # if not, checks each pair element individually. 
-                # If it is used in already existing pair set, it removes 
-                # that set, and adds a new one with a given pair.
-                if any(
-                    [set(pair[0]).issubset(item) for item in self.plugboard]):
-                    self.plugboard.pop([
-                        set(pair[0]).issubset(item) for item in self.plugboard
-                    ].index(True))
-                if any(
-                    [set(pair[1]).issubset(item) for item in self.plugboard]):
-                    self.plugboard.pop([
-                        set(pair[1]).issubset(item) for item in self.plugboard
-                    ].index(True))
-                self.plugboard.append(set(pair))
+        first, second = ord(pair[0]) - 65, ord(pair[1]) - 65
+        # checks if the pair is already in self.plugboard
+        if self._plug[first] == second:
+            return
+        # if either of the letters is used in an existing pair, that pair
+        # is removed: former partners of both letters are unpaired, then
+        # the letters are swapped with each other
+        for partner in (self._plug[first], self._plug[second]):
+            self._plug[partner] = partner
+        self._plug[first] = second
+        self._plug[second] = first
+        self._updatePlugTable()
 
     def unpair_letter(self, letter: str):
-        """takes a letter and deletes the pair set with it if that set 
+        """takes a letter and deletes the pair with it if that pair 
         exists in plugboard
 
         Args:
@@ -204,16 +349,18 @@ class EnigmaMachine:
         """
         assert (len(letter) == 1 and type(letter) == str
                 ), "Wrong input value for letter. Please, enter one letter"
-        for index, pair in enumerate(self.plugboard):
-            # looks if that letter is in any of the pair sets
-            if set(letter.upper()).issubset(pair):
-                # if it is, that pair set gets removed
-                self.plugboard.pop(index)
-                break
+        letter = letter.upper()
+        # if that letter is in any of the pairs, that pair gets removed
+        code = ord(letter) - 65
+        if 0 <= code < 26:
+            partner = self._plug[code]
+            self._plug[code] = code
+            self._plug[partner] = partner
+            self._updatePlugTable()
 
     def plugboardSetter(self, plugboard_values: list = None):
         """takes a list of letter couples and adds them
-        into plugboard as sets
+        into plugboard as pairs
 
         Args:
             plugboard_values ([list of strings], optional): list in 
@@ -225,7 +372,8 @@ class EnigmaMachine:
             return
         elif plugboard_values == []:
             # reset plugboard
-            self.plugboard = []
+            self._plug = bytearray(range(26))
+            self._updatePlugTable()
 
         else:
             invalid = "Entered plugboard values are in invalid format. Please, \
@@ -237,38 +385,24 @@ class EnigmaMachine:
             for pair in plugboard_values:
                 self.add_pair(pair.upper())
 
+    def _updatePlugTable(self):
+        """rebuilds str.translate() table after the plugboard changes
+
+        The table is a string indexed by code point: the first 256 
+        symbols map onto themselves, except capital letters that are 
+        swapped. translate() leaves symbols past the table unchanged.
+        """
+        plugged = bytes(code + 65 for code in self._plug).decode()
+        identity = "".join(map(chr, range(256)))
+        self._plug_table = identity[:65] + plugged + identity[91:]
+
     def rotorHandler(self):
         """when called, makes rotor system turn 1 step"""
-
-        def increase(wheel: int) -> int:
-            """defines rotor position after 1 step increment"""
-            return (wheel + 1) % 26
-
-        # the following portion checks for notches on rotors.
-        # if one of two notches match with current 1st rotor position:
-        if (self.wheel1pos == EnigmaMachine.notches[int(self.rotor_set[0])][0]
-                or self.wheel1pos == EnigmaMachine.notches[int(
-                    self.rotor_set[0])][1]):
-            # 1st rotors turns 1 step
-            self.wheel1pos = increase(self.wheel1pos)
-            # checks if 2nd rotor also has a notch 
-            # at the current position:
-            if (self.wheel2pos == EnigmaMachine.notches[int(
-                    self.rotor_set[1])][0] or self.wheel1pos
-                    == EnigmaMachine.notches[int(self.rotor_set[1])][1]):
-                # 2nd rotor turns 1 step
-                self.wheel2pos = increase(self.wheel2pos)
-                # 3rd rotor turns 1 step
-                self.wheel3pos = increase(self.wheel3pos)
-            else:
-                # 2nd rotor does not have a notch 
-                # at the current position:
-                # just 2nd rotor turns 1 step
-                self.wheel2pos = increase(self.wheel2pos)
-        else:
-            # no rotors has notches at the current position
-            # 1st rotor turns 1 step anyway
-            self.wheel1pos = increase(self.wheel1pos)
+        position = self._positionIndex()
+        following = self._steps.get(position)
+        if following is None:
+            following = self._nextPosition(position)
+        self._positionSetterIndex(following)
 
     def stringChecker(self, input) -> str:
         """checks if a symbol can be converted to a string
@@ -290,30 +424,28 @@ class EnigmaMachine:
 
     def plugboardHandler(self, symbol) -> str:
         """takes a symbol from encrypted/decrypted final message and 
-        swaps it in accordance with plugboard pair sets
+        swaps it in accordance with plugboard pairs
 
         Args:
-            symbol (str): current symbol
+            symbol (str): current symbol, encrypt() and decrypt() convert
+                the whole message with stringChecker() beforehand
 
         Returns:
             swapped symbol (str): if the symbol is a letter that bound to
                 another in plugboard, it is replaced and returned
-                for example, if plugboard has {'A', 'M'}, calling 
+                for example, if plugboard has 'AM', calling 
                 plugboardHandler('A') will return 'M'. If the symbol is 
                 not a letter, or this is a letter that's not in
                 plugboard, the symbol will be returned unchanged.
         """
-        symbol = self.stringChecker(
-            symbol)  # checking if symbol can be a string
-
         assert (
             len(symbol) == 1
         ), "Invalid symbol input. The length of the resulting string is > than 1"
-        for pair in self.plugboard:
-            # if this symbol is in a current set, returns the other 
-            # element of this set
-            if pair.intersection(set(symbol)) != set():
-                return list(pair.difference(set(symbol)))[0]
+        code = ord(symbol) - 65
+        if 0 <= code < 26:
+            # a capital letter is swapped via the permutation table,
+            # unpaired letters map onto themselves
+            return chr(self._plug[code] + 65)
         # else the symbol itself returned
         return symbol
 
@@ -329,21 +461,151 @@ class EnigmaMachine:
             str: symbol that is changed in accordance with passed
                 operating function
         """
-        symbol = self.stringChecker(
-            symbol)  # checking if symbol can be a string
-
-        letters = list(string.ascii_letters)
-        if symbol not in letters:
+        if symbol not in _CODES:
             # if it's not an encryptable/decryptable letter
             return symbol
         else:
             return func(symbol.upper())
 
+    def _positionIndex(self) -> int:
+        """packs current rotor position into a key of the cached tables
+
+        Wheel positions are public attributes, so they are reduced mod 26
+        here, the same way positionSetter() does it.
+
+        Returns:
+            int: wheel1pos + 26 * wheel2pos + 676 * wheel3pos
+        """
+        return (self.wheel1pos % 26 + 26 * (self.wheel2pos % 26)
+                + 676 * (self.wheel3pos % 26))
+
+    def _positionSetterIndex(self, position: int):
+        """sets wheel1pos, wheel2pos, wheel3pos from a position index
+
+        Args:
+            position (int): rotor position index, see _positionIndex()
+        """
+        self.wheel1pos = position % 26
+        self.wheel2pos = position // 26 % 26
+        self.wheel3pos = position // 676
+
+    def _permutationEncryptor(self, position: int) -> str:
+        """builds and caches the whole encryption path at a rotor position
+
+        At a fixed (wheel1pos, wheel2pos, wheel3pos) all the rotors and
+        the reflector together are just a permutation of 26 letters, and
+        there are only 26 ** 3 positions, so each of them is computed once.
+
+        Args:
+            position (int): rotor position index, see _positionIndex()
+
+        Returns:
+            str: letters that EnigmaMachine.direct letters turn into
+        """
+        permutation = self._encryption_path(position % 26,
+                                            position // 26 % 26,
+                                            position // 676)
+        self._fullperm[position] = permutation
+        return permutation
+
+    def _permutationDecryptor(self, position: int) -> str:
+        """builds and caches the whole decryption path at a rotor 
+        position, see _permutationEncryptor()
+
+        Args:
+            position (int): rotor position index, see _positionIndex()
+
+        Returns:
+            str: letters that EnigmaMachine.direct letters turn into
+        """
+        permutation = self._decryption_path(position % 26,
+                                            position // 26 % 26,
+                                            position // 676)
+        self._fullperm_inv[position] = permutation
+        return permutation
+
+    def _nextPosition(self, position: int) -> int:
+        """finds and caches where the rotors turn to from a position
+
+        This is the stepping rule of the machine: it works on plain 
+        integers and does not change the instance's rotor position.
+
+        Args:
+            position (int): rotor position index, see _positionIndex()
+
+        Returns:
+            int: rotor position index after 1 step
+        """
+        wheel1pos = position % 26
+        wheel2pos = position // 26 % 26
+        wheel3pos = position // 676
+        # notches are checked before any rotor turns
+        wheel1_notch = wheel1pos in self._notch1
+        wheel2_notch = wheel2pos in self._notch2
+        # 1st rotor turns 1 step anyway
+        wheel1pos = (wheel1pos + 1) % 26
+        if wheel1_notch:
+            # 1st rotor is at its notch: 2nd rotor turns 1 step
+            wheel2pos = (wheel2pos + 1) % 26
+            if wheel2_notch:
+                # 2nd rotor is at its notch as well: 3rd rotor turns
+                wheel3pos = (wheel3pos + 1) % 26
+        following = wheel1pos + 26 * wheel2pos + 676 * wheel3pos
+        self._steps[position] = following
+        return following
+
+    def _rotorPass(self, message: str, inverse: bool = False) -> list:
+        """runs letters of a message through the rotors and the reflector
+
+        Each letter costs a lookup of the cached permutation for the 
+        current position and a lookup of the cached next position, so 
+        rotorHandler() only runs when a position is visited for the first
+        time. Other symbols are passed unchanged and do not turn rotors.
+
+        Args:
+            message (str): a message to be encrypted or decrypted
+            inverse (bool, optional): if True, the message is decrypted.
+                Defaults to False.
+
+        Returns:
+            list: capital letters and unchanged symbols of the message
+        """
+        if inverse:
+            permutations = self._fullperm_inv
+            build = self._permutationDecryptor
+        else:
+            permutations = self._fullperm
+            build = self._permutationEncryptor
+        permutations = permutations.get
+        steps = self._steps.get
+        next_position = self._nextPosition
+        position = self._positionIndex()
+        output = []
+        append = output.append
+        for symbol in message:
+            code = _CODES.get(symbol)
+            if code is None:
+                # if it's not an encryptable/decryptable letter
+                append(symbol)
+                continue
+            permutation = permutations(position)
+            if permutation is None:
+                permutation = build(position)
+            append(permutation[code])
+            # rotor setup turns 1 step
+            following = steps(position)
+            if following is None:
+                following = next_position(position)
+            position = following
+        self._positionSetterIndex(position)
+        return output
+
     def keyEncryptor(self, key: str) -> str:
         """encrypts a letter according to the current rotors setup
 
         Args:
-            key (str): a letter that enters
+            key (str): a capital letter that enters, parser() passes letters
+                in upper case
 
         Returns:
             str: an encrypted letter that exits
@@ -366,40 +628,24 @@ class EnigmaMachine:
             We subtract 65 from ord(letter) since ord('A') = 65, and 
             letter 'A' should align with the index 0.
         """
-        # signal travels forwards, 1-2-3 rotors
-        primary = EnigmaMachine.rotors[int(
-            self.rotor_set[0])][(ord(key.upper()) - 65 + self.wheel1pos) %
-                                26]  # Letter after rotor 1
-        secondary = EnigmaMachine.rotors[int(
-            self.rotor_set[1])][(ord(primary.upper()) - 65 + self.wheel2pos) %
-                                26]  # Letter after rotor 2
-        tertiary = EnigmaMachine.rotors[int(
-            self.rotor_set[2])][(ord(secondary.upper()) - 65 + self.wheel3pos)
-                                % 26]  # Letter after rotor 3
-
-        # Letter after the reflector
-        reflected = EnigmaMachine.reflector[ord(tertiary.upper()) - 65]
-        # now signal travels backwards, 3-2-1 rotors
-        quaternary = EnigmaMachine.rotors[int(
-            self.rotor_set[2])][(ord(reflected.upper()) - 65 + self.wheel3pos)
-                                % 26]  # Letter after rotor 3
-        quinary = EnigmaMachine.rotors[int(
-            self.rotor_set[1])][(ord(quaternary.upper()) - 65 + self.wheel2pos)
-                                % 26]  # Letter after rotor 2
-        senary = EnigmaMachine.rotors[int(
-            self.rotor_set[0])][(ord(quinary.upper()) - 65 + self.wheel1pos) %
-                                26]  # Letter after rotor 1
+        # the whole path through rotors and reflector at the current
+        # position is one cached permutation
+        position = self._positionIndex()
+        permutation = self._fullperm.get(position)
+        if permutation is None:
+            permutation = self._permutationEncryptor(position)
+        letter = permutation[ord(key) - 65]
 
         # rotor setup turns 1 step
         self.rotorHandler()
         # final letter is returned
-        return senary
+        return letter
 
     def keyDecryptor(self, key: str) -> str:
         """decrypts a letter according to a current rotor setup
 
         Args:
-            key (str):an encrypted letter that enters
+            key (str): an encrypted capital letter that enters
 
         Returns:
             str: a decrypted letter that exits
@@ -423,33 +669,16 @@ class EnigmaMachine:
             e.g. if you encrypted it with [0, 4, 13] rotor positions, it 
             must be decrypted from [0, 4, 13] as well.
         """
-        # Signal travels forwards, 1-2-3 rotors
-        primary = EnigmaMachine.direct[(EnigmaMachine.rotors[int(
-            self.rotor_set[0])].index(key.upper()) - self.wheel1pos) %
-                                       26]  # Letter after rotor 1
-        secondary = EnigmaMachine.direct[(EnigmaMachine.rotors[int(
-            self.rotor_set[1])].index(primary.upper()) - self.wheel2pos) %
-                                         26]  # Letter after rotor 2
-        tertiary = EnigmaMachine.direct[(EnigmaMachine.rotors[int(
-            self.rotor_set[2])].index(secondary.upper()) - self.wheel3pos) %
-                                        26]  # Letter after rotor 3
-
-        reflected = EnigmaMachine.direct[EnigmaMachine.reflector.index(
-            tertiary.upper())]  # Letter after the reflector
-
-        quaternary = EnigmaMachine.direct[(EnigmaMachine.rotors[int(
-            self.rotor_set[2])].index(reflected.upper()) - self.wheel3pos) %
-                                          26]  # Letter after rotor 3
-        quinary = EnigmaMachine.direct[(EnigmaMachine.rotors[int(
-            self.rotor_set[1])].index(quaternary.upper()) - self.wheel2pos) %
-                                       26]  # Letter after rotor 2
-        senary = EnigmaMachine.direct[(EnigmaMachine.rotors[int(
-            self.rotor_set[0])].index(quinary.upper()) - self.wheel1pos) %
-                                      26]  # Letter after rotor 1
+        # the whole path is cached the same way as in keyEncryptor()
+        position = self._positionIndex()
+        permutation = self._fullperm_inv.get(position)
+        if permutation is None:
+            permutation = self._permutationDecryptor(position)
+        letter = permutation[ord(key) - 65]
         # rotor setup turns 1 step
         self.rotorHandler()
         # final letter is returned
-        return senary
+        return letter
 
     def encrypt(
         self,
@@ -474,27 +703,23 @@ class EnigmaMachine:
         # set up parsed plugboard pairs if any
         self.plugboardSetter(plugboard_values)
         self.positionSetter(position)  # set up rotor position if any
-        encrypted = ""
         if self.mode == 0:  # ordinal word length procedure
-            for symbol in message:
-                # decrypts message elementwise
-                encrypted += self.plugboardHandler(
-                    self.parser(symbol, self.keyEncryptor))
-            return encrypted
+            # encrypts message elementwise
+            encrypted = self._rotorPass(message)
         else:
+            # spaces are dropped, the rest is encrypted elementwise
+            symbols = self._rotorPass(message.replace(" ", ""))
+            encrypted = []  # symbols are joined once at the end
+            append = encrypted.append
             ctr = self.mode  # counter
-            for symbol in message:
-                if symbol != " ":  # if symbol is not a space, proceeds
-                    ctr -= 1  # counter decreased by 1
-                    encrypted += self.plugboardHandler(
-                        self.parser(symbol, self.keyEncryptor))
-                    if ctr == 0:
-                        encrypted += " "  # adds a space to encr. string
-                        ctr = self.mode  # reset
-                else:
-                    continue  # if symbol is a space, jumps to the next 
-            # returns encrypted message
-            return encrypted
+            for symbol in symbols:
+                ctr -= 1  # counter decreased by 1
+                append(symbol)
+                if ctr == 0:
+                    append(" ")  # adds a space to encr. string
+                    ctr = self.mode  # reset
+        # plugboard swaps letters of the whole message at once
+        return "".join(encrypted).translate(self._plug_table)
 
     def decrypt(self,
                 encr_message,
@@ -513,17 +738,43 @@ class EnigmaMachine:
         Returns:
             str: decrypted message
         """
+        encr_message = self.stringChecker(
+            encr_message)  # check if message can be converted to a string
 
         # sets up passed plugboard pairs
         self.plugboardSetter(plugboard_values)
         self.positionSetter(position)  # sets up passed rotor positions
-        decrypted = ""
-        for symbol in encr_message:
-            # decrypts message stirng elementwise
-            decrypted += self.parser(self.plugboardHandler(symbol),
-                                     self.keyDecryptor)
-        # returns decrypted message
-        return decrypted
+        # swaps letters of the whole message on the plugboard first
+        plugged = encr_message.translate(self._plug_table)
+        # decrypts message stirng elementwise and returns it
+        return "".join(self._rotorPass(plugged, inverse=True))
+
+
+# Rotor data as letter indices: ord(letter) - 65, built once at module 
+# load. Rotor n is ROTORS[n - 1]. Inverse tables map a letter index to 
+# the position of that letter on the rotor, so decryption does not have
+# to search the rotor with str.index(). NOTCHES holds positions at which
+# each rotor turns the next one.
+ROTORS = tuple(
+    bytes(ord(c) - 65 for c in EnigmaMachine.rotors[number])
+    for number in sorted(EnigmaMachine.rotors))
+INV_ROTORS = tuple(
+    bytes(map(EnigmaMachine.rotors[number].index, EnigmaMachine.direct))
+    for number in sorted(EnigmaMachine.rotors))
+REFLECTOR = bytes(ord(c) - 65 for c in EnigmaMachine.reflector)
+INV_REFLECTOR = bytes(map(EnigmaMachine.reflector.index, EnigmaMachine.direct))
+# bytes.translate() tables for all rotors at all 26 positions, see 
+# EnigmaMachine._shiftedRotor(), so installing a rotor set builds nothing
+ROTOR_TABLES = tuple(EnigmaMachine._shiftedRotor(rotor) for rotor in ROTORS)
+INV_ROTOR_TABLES = tuple(
+    EnigmaMachine._shiftedRotor(rotor, inverse=True) for rotor in INV_ROTORS)
+REFLECTOR_TABLE = REFLECTOR.ljust(256, b"\0")
+INV_REFLECTOR_TABLE = INV_REFLECTOR.ljust(256, b"\0")
+# bytes.translate() table turning letter indices back into capital letters
+LETTERS = EnigmaMachine.direct.encode().ljust(256, b"\0")
+NOTCHES = tuple(
+    frozenset(EnigmaMachine.notches[number])
+    for number in sorted(EnigmaMachine.notches))
 
 
 if __name__ == "__main__":
@@ -9,22 +9,25 @@ class MainApp(tk.Frame, EnigmaMachine):
     """this is Enigma Machine GUI
     """
 
+    # rotor numbers offered by the rotor dropdown menus, built once
+    _ROTOR_OPTIONS = tuple(EnigmaMachine.rotors)
+
     def __init__(self, *args, **kwargs):
         """init main window
 
         Attributes:
             button_list (list): list of commutator (plugboard) buttons 
                 that will remain in a commutator window
-            button_list_updated (list): list of updated commutator 
-                buttons that will be added to the rest in the window.
             style = instance of ttk.Style() 
+            _setwheels_pending (bool): True while a setWheels() call is
+                scheduled for the next idle cycle
 
         """
         tk.Frame.__init__(self, *args, **kwargs)
         EnigmaMachine.__init__(self, *args, **kwargs)
+        self._setwheels_pending = False
         self.initUI()
         self.button_list = []
-        self.button_list_updated = []
         self.style = ttk.Style()
 
     def initUI(self):
@@ -171,6 +174,8 @@ class MainApp(tk.Frame, EnigmaMachine):
         positioning_frame.grid(column=3, row=0, sticky='e')
 
         self.var1 = tk.IntVar()
+        self.var2 = tk.IntVar()
+        self.var3 = tk.IntVar()
 
         self.position_1 = ttk.Spinbox(positioning_frame,
                                       textvariable=self.var1,
@@ -178,23 +183,25 @@ class MainApp(tk.Frame, EnigmaMachine):
                                       to=25,
                                       width=3,
                                       command=self.setWheels)
-        self.position_1.set(self.wheel1pos)
+        self.var1.set(self.wheel1pos)
         self.position_1.grid(column=0, row=0, sticky='nsew', padx=5, pady=5)
 
         self.position_2 = ttk.Spinbox(positioning_frame,
+                                      textvariable=self.var2,
                                       from_=0,
                                       to=25,
                                       width=3,
                                       command=self.setWheels)
-        self.position_2.set(self.wheel2pos)
+        self.var2.set(self.wheel2pos)
         self.position_2.grid(column=1, row=0, sticky='nsew', padx=5, pady=5)
 
         self.position_3 = ttk.Spinbox(positioning_frame,
+                                      textvariable=self.var3,
                                       from_=0,
                                       to=25,
                                       width=3,
                                       command=self.setWheels)
-        self.position_3.set(self.wheel3pos)
+        self.var3.set(self.wheel3pos)
         self.position_3.grid(column=2, row=0, sticky='nsew', padx=5, pady=5)
 
         # Rotors Selected
@@ -204,7 +211,7 @@ class MainApp(tk.Frame, EnigmaMachine):
                                      padx=5)
         rotors_frame.grid(column=2, row=0, sticky='E', padx=5)
 
-        rotor_options = list(self.rotors)
+        rotor_options = self._ROTOR_OPTIONS
 
         self.rotor1_value = tk.IntVar(self)
         self.rotor2_value = tk.IntVar(self)
@@ -229,21 +236,29 @@ class MainApp(tk.Frame, EnigmaMachine):
         self.rotor3.grid(row=0, column=5, padx=5, pady=2, sticky='W')
 
     def onEncode(self):
-        self.setWheels()
+        self._do_setwheels()
         self.mode = int(self.mode_selector.get())
-        direct = self.direct_input.get("1.0", tk.END)
-        self.encrypted_input.delete("1.0", tk.END)
-        self.encrypted_input.insert("1.0", self.encrypt(direct))
+        direct = self._text_get(self.direct_input)
+        self._text_set(self.encrypted_input, self.encrypt(direct))
 
         self.wheelClick()
 
     def onDecode(self):
-        self.setWheels()
-        encrypted = self.encrypted_input.get("1.0", tk.END)
-        self.direct_input.delete("1.0", tk.END)
-        self.direct_input.insert("1.0", self.decrypt(encrypted))
+        self._do_setwheels()
+        encrypted = self._text_get(self.encrypted_input)
+        self._text_set(self.direct_input, self.decrypt(encrypted))
         self.wheelClick()
 
+    @staticmethod
+    def _text_get(widget):
+        # 'end-1c' skips the newline Tk always keeps at the end of a Text
+        return widget.tk.call(widget._w, 'get', '1.0', 'end-1c')
+
+    @staticmethod
+    def _text_set(widget, text):
+        # one Tcl call replaces the contents instead of delete + insert
+        widget.tk.call(widget._w, 'replace', '1.0', 'end-1c', text)
+
     def onReset(self):
         self.direct_input.delete("1.0", tk.END)
         self.encrypted_input.delete("1.0", tk.END)
@@ -251,31 +266,48 @@ class MainApp(tk.Frame, EnigmaMachine):
         self.wheelClick()
 
     def setWheels(self):
-        self.rotor_set = str(self.rotor1_value.get()) + str(
-            self.rotor2_value.get()) + str(self.rotor3_value.get())
-        self.positionSetter([
-            int(self.position_1.get()),
-            int(self.position_2.get()),
-            int(self.position_3.get())
-        ])
+        # spinbox clicks only schedule the update, so a burst of clicks
+        # sets the rotors once per idle cycle
+        if self._setwheels_pending:
+            return
+        self._setwheels_pending = True
+        self.master.after_idle(self._do_setwheels)
+
+    def _do_setwheels(self):
+        self._setwheels_pending = False
+        self.rotor_set = (self.rotor1_value.get(), self.rotor2_value.get(),
+                          self.rotor3_value.get())
+        self.positionSetter(
+            [self.var1.get(), self.var2.get(), self.var3.get()])
 
     def wheelClick(self):
-        self.position_1.set(self.wheel1pos)
-        self.position_2.set(self.wheel2pos)
-        self.position_3.set(self.wheel3pos)
+        self.var1.set(self.wheel1pos)
+        self.var2.set(self.wheel2pos)
+        self.var3.set(self.wheel3pos)
 
     def openCommSettings(self):
         """
         This is child window that opens after 'Comm Settings' 
         button press
 
+        The window is built on the first press only. Closing it hides 
+        the window, and the next press shows it again.
+
         """
+        if (getattr(self, 'comm_window', None) is not None
+                and self.comm_window.winfo_exists()):
+            self.comm_window.deiconify()
+            self.comm_window.grab_set()
+            self.button_creator()
+            return
+
         # Window settings
         self.comm_window = tk.Toplevel(self.master)
         self.comm_window.geometry('230x215')
         self.comm_window.title('Commutator Settings')
         self.comm_window.grab_set()
         self.comm_window.bind('<Return>', lambda event: self.on_add_link())
+        self.comm_window.protocol('WM_DELETE_WINDOW', self.onCommClose)
 
         # grid layout
         self.comm_window.columnconfigure(0, weight=1)
@@ -296,19 +328,30 @@ class MainApp(tk.Frame, EnigmaMachine):
         self.add_button.pack(side='left', pady=5, padx=10,
                              fill='both', expand=1)
 
+        # links frame: one button for each plugboard pair
+        self.links_frame = tk.Frame(self.comm_window)
+        self.links_frame.grid(row=1, columnspan=2, column=0, sticky='nsew')
+        self.links_frame.columnconfigure(0, weight=1)
+        self.links_frame.columnconfigure(1, weight=1)
+
+        # link buttons of this window, and the grid slot of each of them
+        self._link_buttons = {}
+        self._link_slots = {}
         self.button_creator(
         )  # init exising links as buttons when the comm_board is open:
 
+    def onCommClose(self):
+        # the window is hidden, not destroyed, to be shown again later
+        self.comm_window.grab_release()
+        self.comm_window.withdraw()
+
     # ADDS COUPLE AND BUTTON
     def on_add_link(self):
+        couple = self.couple_entry.get().upper()
         # Checking the input before adding it:
-        if self.couple_entry.get().upper().isalpha() and len(self.couple_entry.get().upper()) == 2: ##ENG
+        if len(couple) == 2 and couple.isascii() and couple.isalpha(): ##ENG
             # adding pair to the self.plugboard
-            self.add_pair(self.couple_entry.get().upper())
-            # creating entry for the button to be initialized
-            self.button_list_updated = []
-            for pair in self.plugboard:
-                self.button_list_updated.append(''.join(list(pair)))
+            self.add_pair(couple)
             self.couple_entry.delete(0, tk.END)
             # callback creator
             self.button_creator()
@@ -325,32 +368,36 @@ class MainApp(tk.Frame, EnigmaMachine):
 
     # CREATES BUTTONS ON THE FORM
     def button_creator(self):
-        # Deleting all existing buttons,
-        # to check if there any that are deleted:
-        for widget in self.comm_window.winfo_children()[1:]:
-            widget.destroy()
-
-        # Creating buttons in accordance with self.plugboard:
-        counter = 0
-        for pair in self.plugboard:
-            counter += 1
-            couple = ''.join(list(pair))
-            self.button_link = ttk.Button(
-                self.comm_window,
-                text=f'{couple}',
-                command=lambda x=couple: self.on_linkbutton_click(x))  # deletion function is bound to a text variable of a button.
-            if len(self.plugboard) < 7:
+        # Buttons are kept between calls: only buttons of removed pairs
+        # are destroyed and only new pairs get a button
+        couples = self.plugboard
+        for couple in self._link_buttons.keys() - set(couples):
+            self._link_buttons.pop(couple).destroy()
+            del self._link_slots[couple]
+
+        # Placing buttons in accordance with self.plugboard:
+        for counter, couple in enumerate(couples, 1):
+            button = self._link_buttons.get(couple)
+            if button is None:
+                button = ttk.Button(
+                    self.links_frame,
+                    text=f'{couple}',
+                    command=lambda x=couple: self.on_linkbutton_click(x))  # deletion function is bound to a text variable of a button.
+                self._link_buttons[couple] = button
+            if len(couples) < 7:
                 # buttons occupy the whole window
-                self.button_link.grid(
-                    row=counter+1, columnspan=2, column=0, sticky='nsew')
-            else:
+                slot = (counter-1, 0, 2)
+            elif counter < 7:
                 # buttons occupy half and half
-                if counter < 7:
-                    self.button_link.grid(
-                        row=counter+1, column=0, sticky='nsew')
-                else:
-                    self.button_link.grid(
-                        row=counter-5, column=1, sticky='nsew')
+                slot = (counter-1, 0, 1)
+            else:
+                slot = (counter-7, 1, 1)
+            # a button is only moved if its slot has changed
+            if self._link_slots.get(couple) != slot:
+                row, column, columnspan = slot
+                button.grid(row=row, column=column, columnspan=columnspan,
+                            sticky='nsew')
+                self._link_slots[couple] = slot
 
     # THIS SECTION WAS USED FOR A DIFFERENT UI STYLE
 